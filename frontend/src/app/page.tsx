@@ -36,22 +36,53 @@ export default function Home() {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
+          'Accept': 'text/event-stream',
         },
         body: JSON.stringify({ message: input }),
       });
 
-      if (!response.ok) {
+      if (!response.ok || !response.body) {
         throw new Error(`HTTP error! status: ${response.status}`);
       }
 
-      const data = await response.json();
-      
-      const assistantMessage: Message = { 
-        role: 'assistant', 
-        content: data.response || 'Sorry, I didn\'t receive a proper response.'
-      };
-      
-      setMessages(prev => [...prev, assistantMessage]);
+      // Read the Server-Sent Events stream and grow the reply as text arrives
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      let content = '';
+
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const frames = buffer.split('\n\n');
+        buffer = frames.pop() ?? '';
+
+        for (const frame of frames) {
+          if (!frame.startsWith('data: ')) continue;
+          const event = JSON.parse(frame.slice(6));
+          if (event.error) {
+            throw new Error(event.error);
+          }
+          if (event.delta) {
+            const isFirstDelta = content === '';
+            content += event.delta;
+            const assistantMessage: Message = { role: 'assistant', content };
+            setMessages(prev => isFirstDelta
+              ? [...prev, assistantMessage]
+              : [...prev.slice(0, -1), assistantMessage]);
+          }
+        }
+      }
+
+      if (!content) {
+        const assistantMessage: Message = { 
+          role: 'assistant', 
+          content: 'Sorry, I didn\'t receive a proper response.'
+        };
+        setMessages(prev => [...prev, assistantMessage]);
+      }
     } catch (error) {
       console.error('Error sending message:', error);
       const errorMessage: Message = { 
@@ -116,7 +147,7 @@ export default function Home() {
               </div>
             ))}
             
-            {loading && (
+            {loading && messages[messages.length - 1]?.role !== 'assistant' && (
               <div className="bg-white border border-gray-200 mr-auto max-w-[85%] mb-4 p-4 rounded-lg">
                 <div className="flex items-center gap-2">
                   <span className="text-sm font-semibold">🤖 Nutritionist AI</span>
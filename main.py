@@ -1,12 +1,23 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder
 from pydantic import BaseModel
 import os
 import httpx
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 from dotenv import load_dotenv
 import logging
-import json
+import orjson
+import asyncio
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
 
 # Load environment variables
 load_dotenv()
@@ -15,41 +26,285 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Close the shared HTTP clients when the app shuts down and drop them from
+# their caches so a later startup in the same process gets fresh ones
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    if get_usda_client.cache_info().currsize:
+        await get_usda_client().aclose()
+        get_usda_client.cache_clear()
+    if get_claude.cache_info().currsize:
+        claude = get_claude()
+        if claude:
+            await claude.close()
+        # Forget the closed client so the next startup builds a fresh one
+        get_claude.cache_clear()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Nutrition RAG API with USDA Database",
     description="A nutrition advice chatbot powered by Claude AI and USDA food database",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# CORS middleware - allows requests from any origin
+# Gzip JSON responses, but pass Server-Sent Event streams through untouched
+# since gzip buffers output and would hold back streamed chat deltas. The
+# decision is made from the response content-type, so it holds for every client.
+# NOTE: this overrides GZipResponder.send_with_gzip and copies
+# GZipMiddleware.__call__ from Starlette 0.27 (pinned via fastapi==0.104.1).
+# Newer Starlette rewrote the responder and already skips text/event-stream,
+# so delete these classes and use GZipMiddleware directly when upgrading.
+class EventStreamAwareGZipResponder(GZipResponder):
+    passthrough = False
+
+    async def send_with_gzip(self, message):
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            self.passthrough = content_type.startswith("text/event-stream")
+        if self.passthrough:
+            await self.send(message)
+            return
+        await super().send_with_gzip(message)
+
+class GZipExceptEventStreamMiddleware(GZipMiddleware):
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = EventStreamAwareGZipResponder(
+                self.app, self.minimum_size, compresslevel=self.compresslevel
+            )
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+app.add_middleware(GZipExceptEventStreamMiddleware, minimum_size=500)
+
+# CORS middleware - restricted to FRONTEND_ORIGIN (comma-separated) when set,
+# otherwise any origin without credentials so the response stays cacheable
+FRONTEND_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("FRONTEND_ORIGIN", "").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=FRONTEND_ORIGINS or ["*"],
+    allow_credentials=bool(FRONTEND_ORIGINS),
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
-# Initialize Claude client
-claude = None
-try:
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        logger.error("❌ ANTHROPIC_API_KEY not found in environment variables")
-        raise ValueError("Missing ANTHROPIC_API_KEY")
-    
-    claude = Anthropic(api_key=api_key)
-    logger.info("✅ Claude initialized successfully!")
-    
-except Exception as e:
-    logger.error(f"❌ Claude initialization failed: {e}")
-    claude = None
+# Claude client - created lazily on first use and shared for the process
+@lru_cache(maxsize=1)
+def get_claude():
+    try:
+        api_key = os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            logger.error("❌ ANTHROPIC_API_KEY not found in environment variables")
+            raise ValueError("Missing ANTHROPIC_API_KEY")
+        
+        claude = AsyncAnthropic(
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+        )
+        logger.info("✅ Claude initialized successfully!")
+        return claude
+        
+    except Exception as e:
+        logger.error(f"❌ Claude initialization failed: {e}")
+        return None
 
 # USDA API configuration
 USDA_API_KEY = os.getenv("USDA_API_KEY")
 USDA_BASE_URL = "https://api.nal.usda.gov/fdc/v1"
 
+# Shared USDA client - keeps connections alive across requests instead of
+# paying a new TCP/TLS handshake for every lookup; created lazily and reset
+# on shutdown like the Claude client
+@lru_cache(maxsize=1)
+def get_usda_client():
+    return httpx.AsyncClient(
+        base_url=USDA_BASE_URL,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20),
+        http2=True
+    )
+
+# Claude model and static instructions. The instructions (with the fixed
+# nutrient reference below) are sent as a cached system block so repeat
+# requests reuse the already-processed prefix; they must stay above the
+# 1024-token minimum for prompt caching to take effect.
+CLAUDE_MODEL = "claude-3-5-sonnet-20241022"
+
+NUTRITION_INSTRUCTIONS = """You are a knowledgeable and helpful nutrition expert with access to USDA nutrition database information.
+
+When answering the user's question, please provide:
+1. A clear, informative answer to the user's question
+2. Use the USDA nutrition data provided if it's relevant to the question
+3. Practical advice when applicable
+4. Any important disclaimers about consulting healthcare professionals for medical conditions
+
+Keep your response conversational and easy to understand. If USDA data is provided, reference it as "According to USDA data" or similar.
+
+## Reading USDA FoodData Central data
+- USDA values provided to you are per 100 g of the food as described (raw, cooked, boiled, etc.). Scale to the portion the user asks about and say which portion you used.
+- "Energy" is reported in kcal; call it calories. If a value is in kJ, divide by 4.184.
+- Foundation and SR Legacy entries describe generic foods, not specific brands. Mention that packaged products can differ and the Nutrition Facts label is authoritative for them.
+- Cooking changes weight: meats lose water and become more nutrient-dense per 100 g, while grains and legumes absorb water and become less dense. Compare raw with raw and cooked with cooked.
+- If the data does not match what the user asked about (for example a different cut or preparation), say so rather than presenting it as exact.
+
+## Reference values (FDA Daily Values for adults and children 4 years and older, 2,000 calorie diet)
+Macronutrients and related:
+- Total fat 78 g; saturated fat 20 g; cholesterol 300 mg
+- Total carbohydrate 275 g; dietary fiber 28 g; added sugars 50 g
+- Protein 50 g; sodium 2,300 mg; potassium 4,700 mg
+Vitamins:
+- Vitamin A 900 mcg RAE; vitamin C 90 mg; vitamin D 20 mcg (800 IU); vitamin E 15 mg; vitamin K 120 mcg
+- Thiamin 1.2 mg; riboflavin 1.3 mg; niacin 16 mg NE; vitamin B6 1.7 mg; folate 400 mcg DFE
+- Vitamin B12 2.4 mcg; biotin 30 mcg; pantothenic acid 5 mg; choline 550 mg
+Minerals:
+- Calcium 1,300 mg; iron 18 mg; phosphorus 1,250 mg; magnesium 420 mg; zinc 11 mg
+- Iodine 150 mcg; selenium 55 mcg; copper 0.9 mg; manganese 2.3 mg
+- Chromium 35 mcg; molybdenum 45 mcg; chloride 2,300 mg
+Percent Daily Value = amount in the portion / Daily Value x 100. As a rule of thumb, 5% DV or less per serving is low and 20% DV or more is high.
+
+## Energy and macronutrient guidance
+- Energy per gram: carbohydrate 4 kcal, protein 4 kcal, fat 9 kcal, alcohol 7 kcal. Fiber contributes roughly 2 kcal per gram.
+- Acceptable Macronutrient Distribution Ranges for adults: carbohydrate 45-65%, fat 20-35%, protein 10-35% of calories.
+- Protein RDA for healthy adults is 0.8 g per kg of body weight per day; older adults and athletes often benefit from more (about 1.0-1.6 g/kg), but people with kidney disease may need less.
+- Dietary Guidelines for Americans: keep added sugars below 10% of calories, saturated fat below 10% of calories, and sodium below 2,300 mg per day for most adults.
+- Fiber: about 14 g per 1,000 calories eaten (roughly 25 g per day for women and 38 g for men).
+- Total water from all beverages and foods: about 2.7 L per day for women and 3.7 L for men, more with heat, exercise, pregnancy or breastfeeding.
+- Calorie needs vary widely with age, sex, body size and activity; 2,000 calories is a labeling reference, not a personal target.
+
+## Common portion weights (for scaling per-100 g USDA values)
+- 1 large egg: about 50 g edible portion
+- 1 medium apple: about 182 g; 1 medium banana: about 118 g
+- 1 whole Hass avocado: about 136 g edible portion
+- 1 cup cooked white or brown rice: about 158-195 g; 1 cup cooked quinoa: about 185 g
+- 1/2 cup dry rolled oats: about 40 g
+- 1 slice of sandwich bread: about 28-32 g
+- 1 cup milk: about 244 g; 1 cup plain yogurt: about 245 g; 1 oz cheddar cheese: about 28 g
+- 3 oz cooked chicken, beef, salmon or other fish: about 85 g (roughly the size of a deck of cards)
+- 1 oz almonds: about 28 g, or about 23 almonds
+- 1 cup raw spinach: about 30 g; 1 cup chopped raw broccoli: about 91 g
+Example: if USDA lists 31 g protein per 100 g of cooked chicken breast, a 3 oz (85 g) serving has about 31 x 0.85 = 26 g protein.
+
+## Safety and scope
+- Do not diagnose conditions or prescribe treatments. Recommend a doctor or registered dietitian for medical conditions, pregnancy, breastfeeding, children's growth concerns, food allergies, eating disorders, or rapid weight change.
+- Flag well-known interactions when relevant: vitamin K intake and warfarin, grapefruit and many medications, potassium with kidney disease or certain blood pressure drugs, and high-dose supplements (vitamins A and D, iron) that can be toxic.
+- Avoid extreme recommendations such as very low calorie diets, prolonged fasting, or eliminating whole food groups without medical supervision.
+- If the user mentions signs of a medical emergency (for example a severe allergic reaction), tell them to seek emergency care immediately.
+- Do not invent numbers. If neither the USDA data nor this reference covers a value, give a cautious range and say it is approximate.
+
+## Answer format
+- Lead with a direct answer in one or two sentences.
+- Follow with short bullet points or a small list of foods or numbers when helpful, with units (g, mg, mcg, kcal) on every value.
+- Give portions in everyday terms as well as grams (for example "1 cup cooked rice, about 158 g").
+- Keep most answers under about 250 words unless the user asks for detail or a meal plan.
+- End with a brief disclaimer only when the question touches health conditions, medications, pregnancy, or supplements."""
+
+# Built once so the cached prefix is byte-identical on every request; never
+# interpolate per-request values (timestamps, IDs) into it
+NUTRITION_SYSTEM_BLOCK = {
+    "type": "text",
+    "text": NUTRITION_INSTRUCTIONS,
+    "cache_control": {"type": "ephemeral"}
+}
+
+# Maximum number of detected foods looked up in USDA per chat request
+MAX_USDA_FOODS = 3
+
+# Simple food detection (you can make this more sophisticated)
+FOOD_KEYWORDS = ["calories", "protein", "nutrition", "nutrients", "vitamin", "mineral"]
+
+# Common food words to search for
+FOOD_INDICATORS = ["chicken", "beef", "apple", "banana", "rice", "bread", "milk", "egg", "fish", "salmon", "broccoli", "spinach", "cheese", "yogurt", "oats", "quinoa", "almonds", "avocado"]
+
+# Compiled once so each message is scanned in a single case-insensitive pass
+FOOD_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, FOOD_KEYWORDS)), re.IGNORECASE)
+FOOD_INDICATOR_PATTERN = re.compile("|".join(map(re.escape, FOOD_INDICATORS)), re.IGNORECASE)
+
+class QueryCache:
+    """Thread-safe LRU cache with per-entry TTL and hit/miss/eviction/expiration counters"""
+
+    def __init__(self, max_size: int = 2000, ttl_seconds: int = 600):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def purge_expired(self):
+        with self._lock:
+            now = time.monotonic()
+            expired = [
+                key for key, (_, stored_at) in self._entries.items()
+                if now - stored_at > self.ttl_seconds
+            ]
+            for key in expired:
+                del self._entries[key]
+            self.expirations += len(expired)
+
+    def stats(self):
+        with self._lock:
+            # Drop stale entries first so size only counts live ones
+            self.purge_expired()
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+# USDA data changes rarely, so results live until TTL expiry or restart
+usda_search_cache = QueryCache(max_size=2000, ttl_seconds=600)
+usda_details_cache = QueryCache(max_size=2000, ttl_seconds=600)
+
+def sse_frame(payload):
+    """Encode a payload as one Server-Sent Events data frame"""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
 # Request models
 class ChatRequest(BaseModel):
     message: str
@@ -66,26 +321,30 @@ async def search_usda_food(query: str, max_results: int = 5):
     if not USDA_API_KEY:
         return None
     
+    cache_key = (query, max_results)
+    cached = usda_search_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{USDA_BASE_URL}/foods/search",
-                params={
-                    "query": query,
-                    "dataType": ["Foundation", "SR Legacy"],
-                    "pageSize": max_results,
-                    "api_key": USDA_API_KEY
-                },
-                timeout=10.0
-            )
+        response = await get_usda_client().get(
+            "/foods/search",
+            params={
+                "query": query,
+                "dataType": ["Foundation", "SR Legacy"],
+                "pageSize": max_results,
+                "api_key": USDA_API_KEY
+            }
+        )
+        
+        if response.status_code == 200:
+            foods = response.json().get("foods", [])
+            usda_search_cache.set(cache_key, foods)
+            return foods
+        else:
+            logger.warning(f"USDA API error: {response.status_code}")
+            return None
             
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("foods", [])
-            else:
-                logger.warning(f"USDA API error: {response.status_code}")
-                return None
-                
     except Exception as e:
         logger.error(f"USDA search error: {e}")
         return None
@@ -95,20 +354,24 @@ async def get_usda_food_details(fdc_id: int):
     if not USDA_API_KEY:
         return None
     
+    cached = usda_details_cache.get(fdc_id)
+    if cached is not None:
+        return cached
+    
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{USDA_BASE_URL}/food/{fdc_id}",
-                params={"api_key": USDA_API_KEY},
-                timeout=10.0
-            )
+        response = await get_usda_client().get(
+            f"/food/{fdc_id}",
+            params={"api_key": USDA_API_KEY}
+        )
+        
+        if response.status_code == 200:
+            food_details = response.json()
+            usda_details_cache.set(fdc_id, food_details)
+            return food_details
+        else:
+            logger.warning(f"USDA details error: {response.status_code}")
+            return None
             
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.warning(f"USDA details error: {response.status_code}")
-                return None
-                
     except Exception as e:
         logger.error(f"USDA details error: {e}")
         return None
@@ -158,6 +421,7 @@ async def root():
 
 @app.get("/api/health", response_model=HealthResponse)
 async def health():
+    claude = get_claude()
     return HealthResponse(
         status="healthy",
         claude_available=claude is not None,
@@ -169,6 +433,7 @@ async def health():
 @app.post("/api/chat")
 async def chat(request: ChatRequest):
     # Validate Claude is available
+    claude = get_claude()
     if not claude:
         logger.error("Claude not initialized - API key issue")
         raise HTTPException(
@@ -189,71 +454,51 @@ async def chat(request: ChatRequest):
         # Try to extract food names from the question for USDA lookup
         usda_context = ""
         
-        # Simple food detection (you can make this more sophisticated)
-        food_keywords = ["calories", "protein", "nutrition", "nutrients", "vitamin", "mineral"]
-        if any(keyword in request.message.lower() for keyword in food_keywords):
+        if FOOD_KEYWORD_PATTERN.search(request.message):
             
-            # Extract potential food names (basic implementation)
-            words = request.message.lower().split()
-            potential_foods = []
+            # Extract potential food names in the order they are mentioned
+            potential_foods = list(dict.fromkeys(
+                food.lower() for food in FOOD_INDICATOR_PATTERN.findall(request.message)
+            ))
             
-            # Common food words to search for
-            food_indicators = ["chicken", "beef", "apple", "banana", "rice", "bread", "milk", "egg", "fish", "salmon", "broccoli", "spinach", "cheese", "yogurt", "oats", "quinoa", "almonds", "avocado"]
-            
-            for food in food_indicators:
-                if food in request.message.lower():
-                    potential_foods.append(food)
-            
-            # Search USDA for the first found food
+            # Search USDA for the detected foods concurrently
             if potential_foods:
-                logger.info(f"Searching USDA for: {potential_foods[0]}")
-                usda_foods = await search_usda_food(potential_foods[0], max_results=1)
+                potential_foods = potential_foods[:MAX_USDA_FOODS]
+                logger.info(f"Searching USDA for: {', '.join(potential_foods)}")
+                search_results = await asyncio.gather(
+                    *[search_usda_food(food, max_results=1) for food in potential_foods]
+                )
                 
-                if usda_foods and len(usda_foods) > 0:
-                    # Get detailed nutrition info
-                    fdc_id = usda_foods[0].get("fdcId")
-                    if fdc_id:
-                        food_details = await get_usda_food_details(fdc_id)
-                        if food_details:
-                            usda_context = format_nutrition_data(food_details)
-                            logger.info("✅ Retrieved USDA nutrition data")
-
-        # Create enhanced nutrition-focused prompt
-        nutrition_prompt = f"""You are a knowledgeable and helpful nutrition expert with access to USDA nutrition database information.
-
-User Question: {request.message}
-
-{usda_context}
+                # Get detailed nutrition info for the top match of each food
+                fdc_ids = [
+                    usda_foods[0].get("fdcId")
+                    for usda_foods in search_results
+                    if usda_foods
+                ]
+                fdc_ids = [fdc_id for fdc_id in fdc_ids if fdc_id]
+                if fdc_ids:
+                    all_details = await asyncio.gather(
+                        *[get_usda_food_details(fdc_id) for fdc_id in fdc_ids]
+                    )
+                    usda_context = "".join(
+                        format_nutrition_data(food_details)
+                        for food_details in all_details
+                        if food_details
+                    )
+                    if usda_context:
+                        logger.info("✅ Retrieved USDA nutrition data")
 
-Please provide:
-1. A clear, informative answer to the user's question
-2. Use the USDA nutrition data above if it's relevant to the question
-3. Practical advice when applicable
-4. Any important disclaimers about consulting healthcare professionals for medical conditions
+        # Cached static instructions first, then the per-request USDA context
+        # (left uncached since it varies with the foods asked about); only the
+        # user's question is sent in messages
+        system_blocks = [NUTRITION_SYSTEM_BLOCK]
+        if usda_context:
+            system_blocks.append({
+                "type": "text",
+                "text": usda_context
+            })
 
-Keep your response conversational and easy to understand. If USDA data is provided, reference it as "According to USDA data" or similar."""
-
-        # Call Claude API
-        response = claude.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=800,
-            temperature=0.7,
-            messages=[{
-                "role": "user",
-                "content": nutrition_prompt
-            }]
-        )
-        
-        # Extract response text
-        response_text = response.content[0].text
-        logger.info("✅ Successfully generated enhanced Claude response")
-        
-        return {
-            "response": response_text,
-            "sources": ["Claude AI", "USDA FoodData Central"] if usda_context else ["Claude AI"],
-            "usda_data_used": bool(usda_context),
-            "model": "claude-3-5-sonnet-20241022"
-        }
+        sources = ["Claude AI", "USDA FoodData Central"] if usda_context else ["Claude AI"]
         
     except Exception as e:
         # Log the full error for debugging
@@ -265,6 +510,49 @@ Keep your response conversational and easy to understand. If USDA data is provid
             detail=f"Sorry, I encountered an error processing your nutrition question. Please try again."
         )
 
+    # Stream Claude's answer as Server-Sent Events: one "delta" frame per text
+    # chunk, then a final frame with the sources used
+    async def event_stream():
+        try:
+            async with claude.messages.stream(
+                model=CLAUDE_MODEL,
+                max_tokens=800,
+                temperature=0.7,
+                system=system_blocks,
+                messages=[{
+                    "role": "user",
+                    "content": request.message
+                }]
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield sse_frame({"delta": text})
+                usage = (await stream.get_final_message()).usage
+            
+            logger.info(
+                f"Prompt cache: read={usage.cache_read_input_tokens} "
+                f"created={usage.cache_creation_input_tokens} "
+                f"uncached={usage.input_tokens}"
+            )
+            logger.info("✅ Successfully generated enhanced Claude response")
+            
+            yield sse_frame({
+                "sources": sources,
+                "usda_data_used": bool(usda_context),
+                "model": CLAUDE_MODEL
+            })
+            
+        except Exception as e:
+            logger.error(f"❌ Enhanced chat stream error: {str(e)}")
+            yield sse_frame({
+                "error": "Sorry, I encountered an error processing your nutrition question. Please try again."
+            })
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # Test endpoint for USDA API
 @app.get("/api/test-usda/{food_name}")
 async def test_usda(food_name: str):
@@ -275,13 +563,21 @@ async def test_usda(food_name: str):
     foods = await search_usda_food(food_name, max_results=3)
     return {"query": food_name, "results": foods}
 
+# Cache statistics for the USDA lookup caches
+@app.get("/api/cache-stats")
+async def cache_stats():
+    return {
+        "usda_search": usda_search_cache.stats(),
+        "usda_details": usda_details_cache.stats()
+    }
+
 # Run the application
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
     
     logger.info(f"🚀 Starting Enhanced Nutrition RAG API on port {port}")
-    logger.info(f"📋 Claude status: {'✅ Ready' if claude else '❌ Not available'}")
+    logger.info(f"📋 Claude status: {'✅ Ready' if get_claude() else '❌ Not available'}")
     logger.info(f"🥗 USDA status: {'✅ Ready' if USDA_API_KEY else '❌ Not available'}")
     
     uvicorn.run(